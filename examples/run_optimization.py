@@ -96,13 +96,15 @@ def run_opt(
     ##########################################
     geo_paths = []
     pes_paths = []
-    t0 = timer.time()
+    log_iters = set(range(0, args.num_optimizer_iterations, 50))
+    loss_fig, loss_ax = plt.subplots()
+    # Integrals stay on device and are only copied when the curve is redrawn
     loss_curve = []
+    t0 = timer.time()
     for optim_idx in range(args.num_optimizer_iterations):
         path_integral = optimizer.optimization_step(path, integrator)
-        print(f'optim_idx:, {optim_idx}, {path_integral.integral}')
-        loss_curve.append(path_integral.integral.item())
-        if optim_idx%50 == 0:
+        loss_curve.append(path_integral.integral.detach())
+        if optim_idx in log_iters:
             print("EVAL TIME", (timer.time()-t0)/60)
             path_output = logger.optimization_step(
                 optim_idx,
@@ -115,14 +117,16 @@ def run_opt(
                 add_azimuthal_dof=args.add_azimuthal_dof,
                 add_translation_dof=args.add_translation_dof
             )
-            fig, ax = plt.subplots()
-            ax.plot(loss_curve)
-            fig.savefig("./plots/loss_curve.png")
+            loss_ax.clear()
+            loss_ax.plot(torch.stack(loss_curve).flatten().cpu().numpy())
+            loss_fig.savefig("./plots/loss_curve.png")
 
+    plt.close(loss_fig)
+    for optim_idx, integral in enumerate(torch.stack(loss_curve).tolist()):
+        print(f'optim_idx:, {optim_idx}, {integral}')
     print("EVAL TIME", (timer.time()-t0)/60)
-    # Plot gif animation of the MEP optimization (only for 2d potentials)
+    # Animate the MEP optimization as mp4 or gif (only for 2d potentials)
     if args.make_animation:
-        geo_paths = potential.point_transform(torch.tensor(geo_paths))
         ani_name = f"{config.potential}_W{path_config.path_params['n_embed']}_D{path_config.path_params['depth']}_LR{config.optimizer_params['lr']}"
         visualize.animate_optimization_2d(
             geo_paths, ani_name, ani_name,
@@ -98,11 +98,14 @@ def run_opt(
     ##########################################
     geo_paths = []
     pes_paths = []
+    log_iters = set(range(0, args.num_optimizer_iterations, 250))
+    # Printed after the loop, formatting them each step forces a device sync
+    integrals = []
     t0 = timer.time()
     for optim_idx in range(args.num_optimizer_iterations):
         path_integral = optimizer.optimization_step(path, integrator)
-        print(f'optim_idx:, {optim_idx}, {path_integral.integral}')
-        if optim_idx%250 == 0:
+        integrals.append(path_integral.integral.detach())
+        if optim_idx in log_iters:
             print("EVAL TIME", (timer.time()-t0)/60)
             path_output = logger.optimization_step(
                 optim_idx,
@@ -116,10 +119,11 @@ def run_opt(
                 add_translation_dof=args.add_translation_dof
             )
 
+    for optim_idx, integral in enumerate(torch.stack(integrals).tolist()):
+        print(f'optim_idx:, {optim_idx}, {integral}')
     print("EVAL TIME", (timer.time()-t0)/60)
-    # Plot gif animation of the MEP optimization (only for 2d potentials)
+    # Animate the MEP optimization as mp4 or gif (only for 2d potentials)
     if args.make_animation:
-        geo_paths = potential.point_transform(torch.tensor(geo_paths))
         ani_name = f"{config.potential}_W{path_config.path_params['n_embed']}_D{path_config.path_params['depth']}_LR{config.optimizer_params['lr']}"
         visualize.animate_optimization_2d(
             geo_paths, ani_name, ani_name,
@@ -7,9 +7,15 @@ class MinimaUpdate():
         self.n_steps = n_steps
 
     def find_minima(self, initial_points=[]):
-        self.minima = [
-            self.find_minimum(torch.tensor(point)) for point in initial_points
-        ]
+        if len(initial_points) == 0:
+            self.minima = []
+            return self.minima
+
+        # Minimizations are independent, so run them as a single batch
+        points = torch.stack(
+            [torch.as_tensor(point) for point in initial_points]
+        )
+        self.minima = list(torch.unbind(self.find_minimum(points)))
         return self.minima
 
     def find_minimum(self, point, log_frequency=1000):
@@ -199,6 +199,34 @@ print("grad", grads)
 print("starting weights")
 optim = optax.adabelief(0.01)
 opt_state = optim.init(eqx.filter(path, eqx.is_inexact_array))
+
+
+@eqx.filter_jit
+def make_step(
+        ti: jnp.array,
+        yi: jnp.array,
+        model: NeuralODE,
+        opt_state
+):
+    """
+    Take a single compiled optimization step.
+
+    Args:
+        ti (jnp.array): Time points.
+        yi (jnp.array): Input data.
+        model (NeuralODE): NeuralODE model.
+        opt_state: Optimizer state.
+
+    Returns:
+        tuple: Loss value, updated model, and updated optimizer state.
+    """
+    loss, grads = grad_loss(model, ti, yi)
+    updates, opt_state = optim.update(grads, opt_state)
+    model = eqx.apply_updates(model, updates)
+    return loss, model, opt_state
+
+
+ti, yi = jnp.arange(10)/9, jnp.arange(10)
 for i in range(150):
     if i%10 == 0 and i > 0:
         if is_test:
@@ -206,14 +234,4 @@ for i in range(150):
         else:
             weight_norm = jnp.linalg.norm(path.func.mlp.layers[0].weight)
         print("loss and weights at", i, loss, weight_norm)
-    loss, grads = grad_loss(path, jnp.arange(10)/9, jnp.arange(10))
-    updates, opt_state = optim.update(grads, opt_state)
-    path = eqx.apply_updates(path, updates)
-
-"""
-@eqx.filter_jit
-def make_step(ti, yi, model, opt_state):
-    updates, opt_state = optim.update(grads, opt_state)
-    model = eqx.apply_updates(model, updates)
-    return loss, model, opt_state
-"""
+    loss, path, opt_state = make_step(ti, yi, path, opt_state)
@@ -3,14 +3,10 @@ import torch
 import torch.distributed as dist
 import numpy as np
 from dataclasses import dataclass
-from enum import Enum
 
-from torchdiffeq import odeint
 from torchpathdiffeq import SerialAdaptiveStepsizeSolver, RKParallelAdaptiveStepsizeSolver
 from .metrics import Metrics
 
-from .metrics import Metrics
-
 @dataclass
 class IntegralOutput():
     integral: torch.Tensor
@@ -147,6 +143,8 @@ class ODEintegrator(Metrics):
         return ode_fxn(vals)
 
     def serial_path_integral(self, path, fxn_name, t_init=0., t_final=1.):
+        from torchdiffeq import odeint
+
         print("TODO: adaptive integrator evaluates t>1, how to set hard limits?")
         ode_fxn, _ = self._get_ode_eval_fxn(fxn_name=fxn_name, path=path)
         integral = odeint(
@@ -197,7 +195,6 @@ class ODEintegrator(Metrics):
  
     def _parallel_path_integral(self, path, fxn_name, t_init=0., t_final=1., eval_times=None):
        
-        print("INPUT EVAL TIMES", eval_times.shape)
         self._parallel_integral(
             ode_fxn=lambda x: torch.abs(path.geometric_path(x)),
             t_init=t_init,
@@ -220,14 +217,10 @@ class ODEintegrator(Metrics):
         )
         eval_geos = geos[mask]
         eval_times = self.integral_times[mask]
-        print("eval times shape", eval_times.shape)
-        print(eval_times[:,0])
         delta_times = eval_times[1:] - eval_times[:-1]
-        print("means", torch.mean(delta_times))
 
         _, eval_fxn = self._get_ode_eval_fxn(fxn_name=fxn_name, path=path)
         loss_evals = eval_fxn(path=path, t=eval_times)
-        print("EVALS", loss_evals)
         integral = torch.sum(loss_evals[:-1]*delta_times)
 
         return integral
@@ -240,13 +233,10 @@ class ODEintegrator(Metrics):
         idxs_old = torch.tensor([], dtype=torch.int)
         idxs_new = torch.arange(len(eval_times))
         while len(eval_times) > 0:
-            if times is not None:
-                print("TIMES BEFORE ADD", len(times), times[77:85,0])
             # Add points where points are too far
             geos, times = self._add_parallel_geometries(
                 path, old_geos, old_times, eval_times, idxs_old, idxs_new
             )
-            print("TIMES AFTER ADD", len(times), times[77:85,0])
 
             # Remove points that are too close
             geos, times = self._remove_parallel_geometries(geos, times)
@@ -256,7 +246,6 @@ class ODEintegrator(Metrics):
                 geos, times = self._parallel_integral_geometries(
                     path, eval_times[time_mask]
                 )
-            print("TIMES AFTER REMOVE", len(times))#, times[:10])
 
             # Determine where difference between structures is too small
             deltas = self._geo_deltas(geos)
@@ -271,10 +260,8 @@ class ODEintegrator(Metrics):
                 eval_deltas = torch.unsqueeze(eval_deltas, 1)\
                     *(1 + torch.unsqueeze(torch.arange(self.n_added_evals), 0)) #[n_adds, n_added_evals]
                 eval_times = times[add_idxs]*torch.ones((n_adds, self.n_added_evals)) #[n_adds, n_added_evals]
-                print("EVAL TIME SHAPE", eval_times.shape)
                 eval_times = torch.unsqueeze(eval_times, 1) + eval_deltas 
                 eval_times = torch.unsqueeze(eval_times.flatten(), 1)
-                print("IDXS FROM MASK", n_adds)#, torch.where(add_mask))
                 idxs_new = torch.unsqueeze(add_idxs, 1)\
                     + torch.unsqueeze(1 + torch.arange(self.n_added_evals), 0)\
                     + torch.unsqueeze(
@@ -290,14 +277,6 @@ class ODEintegrator(Metrics):
             old_geos = geos
             old_times = times
             
-            if len(eval_times) > 0:
-                print("LARGE DELTAS", deltas[deltas > self.dxdx][:10])
-                print("LARGE IDXS", torch.where(deltas[deltas > self.dxdx])[0][:10])
-                print("LAST DELTAS", deltas[-10:])
-                print("LEN TIMES", len(times))
-            print("NEW IDXS", idxs_new[:10])
-            print("CUR TIMES", times[:10])
-            print("NEW TIMES", eval_times[:10])
             if len(eval_times) and eval_times[1,0] == 0:
                 raise ValueError(f"Second time value is 0 {eval_times[:10,0]}")
             if len(eval_times) and torch.any(eval_times[:,0] < 0.0):
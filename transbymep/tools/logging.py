@@ -1,4 +1,5 @@
 import numpy as np
+import matplotlib.pyplot as plt
 from .visualize import plot_path
 
 
@@ -33,12 +34,13 @@ class logging():
         #print("test grad", grads.mlp.layers[0].weight)
         path_output = path.get_path(return_velocity=True, return_force=True)
         #print('PATH SHAPE', geo_path.shape, pes_path.shape)
+        # Detach recorded paths so they do not keep each step's graph alive
         if geo_paths is not None:
-            geo_paths.append(path_output.geometric_path)
+            geo_paths.append(path_output.geometric_path.detach())
         if pes_paths is not None:
-            pes_paths.append(path_output.potential_path)
+            pes_paths.append(path_output.potential_path.detach())
         if plot:
-            plot_path(
+            figs, _ = plot_path(
                 path_output.geometric_path.detach().to('cpu').numpy(),
                 f"test_plot_{step:03d}",
                 pes_fxn=potential,
@@ -47,4 +49,7 @@ class logging():
                 add_translation_dof=add_translation_dof,
                 add_azimuthal_dof=add_azimuthal_dof
             )
+            # Release the figures, they are already saved to disk
+            for fig in figs if isinstance(figs, list) else [figs]:
+                plt.close(fig)
         return path_output
\ No newline at end of file
@@ -35,23 +35,28 @@ def eval_contour_vals(
     y_min,
     y_max,
     step_size=0.01,
-    add_dof=False
+    add_dof=False,
+    rows_per_chunk=50
 ):
     x_vals = np.arange(x_min, x_max, step_size)
     y_vals = np.arange(y_min, y_max, step_size)
-    l,r = np.meshgrid(x_vals, y_vals)
     size = len(x_vals)
-    args = np.reshape(np.stack([l,r],axis=2), (-1, 2))
-    if add_dof:
-        args = np.concatenate([args, np.zeros((args.shape[0], 1))], axis=1)
-        #    jnp.array([x_vals, y_vals, jnp.zeros(len(x_vals))]).transpose()
-        #)
-        #trans_xy_vals = np.array(trans_xy_vals)
-        #x_vals = jnp.expand_dims(trans_xy_vals[:,0], -1)
-        #y_vals = jnp.expand_dims(trans_xy_vals[:,1], -1)
+    # Write the grid directly into one buffer, the added dof stays at zero.
+    # Single precision is plenty for contours, bfloat16 cannot resolve the grid
+    n_dims = 3 if add_dof else 2
+    args = np.zeros((len(y_vals), size, n_dims), dtype=np.float32)
+    args[:,:,0] = x_vals[None,:]
+    args[:,:,1] = y_vals[:,None]
+    args = np.reshape(args, (-1, n_dims))
     args = from_numpy([args])[0]
-    z_vals = potential(args)
-    trans_xy_vals = potential.point_transform(args)
+    # Evaluate blocks of grid rows so peak memory does not scale with size**2
+    z_vals, trans_xy_vals = [], []
+    with torch.no_grad():
+        for args_chunk in torch.split(args, size*rows_per_chunk):
+            z_vals.append(potential(args_chunk))
+            trans_xy_vals.append(potential.point_transform(args_chunk))
+    z_vals = torch.concatenate(z_vals)
+    trans_xy_vals = torch.concatenate(trans_xy_vals)
     z_vals, trans_xy_vals = to_numpy([z_vals, trans_xy_vals])
     return (np.reshape(trans_xy_vals[:,0], (size, size)),
         np.reshape(trans_xy_vals[:,1], (size, size)),
@@ -104,13 +109,21 @@ def _plot_added_rot_dof(
     fig_size = (plot_params['fig_size'][0], plot_params['fig_size'][0]*1.2)
     _gridspec = dict(gridspec)
     _gridspec['height_ratios'] = _gridspec['height_ratios'][:] + [1]
-    path_th = np.array(np.arctan2(path[:,0], path[:,-1]))
+    path_th = np.arctan2(path[:,0], path[:,-1])
     time = np.linspace(0, 1, len(path_th))
 
+    # Transform both plotted paths in a single batched call
+    path_x = np.concatenate([path[:,:-1], np.zeros((path.shape[0], 1))], axis=-1)
+    paths_t = from_numpy([np.stack([path, path_x])])[0]
+    if pes_fxn is not None:
+        paths_t = pes_fxn.point_transform(paths_t)
+    path_t, path_x_t = to_numpy([paths_t])[0]
+
     fig_xz, ax_xz = plt.subplots(4, 1, figsize=fig_size, gridspec_kw=_gridspec)
     _, contour_vals = _plot_path(
         ax_xz, path, pes_fxn, plot_min_max, levels,
-        contour_vals=contour_vals, return_contour_vals=True, add_dof=True
+        contour_vals=contour_vals, return_contour_vals=True, add_dof=True,
+        transformed_path=path_t
     )
     ax_xz[3].plot(time, path_th)
     ax_xz[3].set_xlim(0,1)
@@ -119,10 +132,9 @@ def _plot_added_rot_dof(
     
     fig_x, ax_x = plt.subplots(4, 1, figsize=fig_size, gridspec_kw=_gridspec)
     _, contour_vals = _plot_path(
-        ax_x,
-        np.concatenate([path[:,:-1], np.zeros((path.shape[0], 1))], axis=-1),
-        pes_fxn, plot_min_max, levels,
-        contour_vals=contour_vals, return_contour_vals=True, add_dof=True
+        ax_x, path_x, pes_fxn, plot_min_max, levels,
+        contour_vals=contour_vals, return_contour_vals=True, add_dof=True,
+        transformed_path=path_x_t
     )
     ax_x[3].plot(time, path_th)
     ax_x[3].set_xlim(0,1)
@@ -155,7 +167,8 @@ def _plot_path(
         levels=None,
         contour_vals=None,
         return_contour_vals=False,
-        add_dof=False
+        add_dof=False,
+        transformed_path=None
     ):
 
     if pes_fxn is not None:
@@ -170,11 +183,13 @@ def _plot_path(
     else:
         contour_vals = None
     
-    path = from_numpy([path])[0]
-    path = pes_fxn.point_transform(path)
-    path = to_numpy([path])[0]
+    if transformed_path is None:
+        path = from_numpy([path])[0]
+        path = pes_fxn.point_transform(path)
+        transformed_path = to_numpy([path])[0]
+    path = transformed_path
     ax[0].plot(path[:,0], path[:,1], color='r', linestyle='-')
-    velocity = np.sqrt(np.sum((path[:-1] - path[1:])**2, axis=-1))
+    velocity = np.linalg.norm(np.diff(path, axis=0), axis=-1)
     ax[2].plot(np.linspace(0, 1, len(path)-1), velocity)
 
     return ax, contour_vals
@@ -262,7 +277,8 @@ def animate_optimization_2d(
         contour_vals=None,
         add_translation_dof=False,
         add_azimuthal_dof=False,
-        plot_dir='./plots/'
+        plot_dir='./plots/',
+        frame_interval=200
     ):
 
     fig, ax = plt.subplots()
@@ -273,6 +289,16 @@ def animate_optimization_2d(
     fig.savefig(contour_file + '.png')
     plot_artist = ax[0].plot([], [], color='red', linestyle='-')[0]
 
+    # Transform all frames in a single batched call, not once per frame
+    if isinstance(paths, (list, tuple)):
+        paths = torch.stack([torch.as_tensor(path) for path in paths])
+    else:
+        paths = torch.as_tensor(paths)
+    with torch.no_grad():
+        if pes_fxn is not None:
+            paths = pes_fxn.point_transform(paths)
+        paths = to_numpy([paths])[0]
+
 
     def animation_function(path):
         if add_translation_dof and False:
@@ -283,7 +309,20 @@ def animate_optimization_2d(
 
 
     print("Plotting animation", len(paths), paths[0].shape)
-    ani = animation.FuncAnimation(fig, animation_function, frames=paths)
+    ani = animation.FuncAnimation(
+        fig, animation_function, frames=paths, interval=frame_interval
+    )
     os.makedirs(plot_dir, exist_ok=True)
-    ani.save(os.path.join(plot_dir, contour_file + ".gif"))
+    # Stream frames to ffmpeg when available instead of encoding them in Python,
+    # both writers take their frame rate from frame_interval
+    if animation.writers.is_available('ffmpeg'):
+        ani_path = os.path.join(plot_dir, contour_file + ".mp4")
+        ani.save(ani_path, writer='ffmpeg')
+    else:
+        ani_path = os.path.join(plot_dir, contour_file + ".gif")
+        ani.save(ani_path)
+    plt.close(fig)
+    print("Animated", ani_path)
+
+    return ani_path
 